@@ -13,7 +13,7 @@ from PIL import Image, ImageGrab
 from prompt_toolkit.completion import Completion, PathCompleter
 from prompt_toolkit.document import Document
 
-from aider import models, prompts, voice
+from aider import models, prompts, utils, voice
 from aider.editor import pipe_editor
 from aider.format_settings import format_settings
 from aider.help import Help, install_help_extra
@@ -761,6 +761,10 @@ class Commands:
             if os.path.isabs(pattern):
                 # Handle absolute paths
                 raw_matched_files = [Path(pattern)]
+            elif not any(c in pattern for c in "*?["):
+                # A literal path needs no glob walk
+                literal = Path(self.coder.root) / pattern
+                raw_matched_files = [literal] if literal.exists() else []
             else:
                 try:
                     raw_matched_files = list(Path(self.coder.root).glob(pattern))
@@ -770,23 +774,22 @@ class Commands:
             self.io.tool_error(f"Error matching {pattern}: {err}")
             raw_matched_files = []
 
+        # Make paths relative to the root with a prefix slice, skipping a
+        # Path construction and relative_to() parse per matched file
+        root_prefix = str(self.coder.root).rstrip(os.sep) + os.sep
+        prefix_len = len(root_prefix)
         matched_files = []
         for fn in raw_matched_files:
-            matched_files += expand_subdir(fn)
-
-        matched_files = [
-            fn.relative_to(self.coder.root)
-            for fn in matched_files
-            if fn.is_relative_to(self.coder.root)
-        ]
+            for fname in expand_subdir(fn):
+                if fname.startswith(root_prefix):
+                    matched_files.append(fname[prefix_len:])
 
         # if repo, filter against it
         if self.coder.repo:
-            git_files = self.coder.repo.get_tracked_files()
-            matched_files = [fn for fn in matched_files if str(fn) in git_files]
+            git_files = set(self.coder.repo.get_tracked_files())
+            matched_files = [fn for fn in matched_files if fn in git_files]
 
-        res = list(map(str, matched_files))
-        return res
+        return matched_files
 
     def cmd_add(self, args):
         "Add files to the chat so aider can edit them or review them in detail"
@@ -1312,11 +1315,19 @@ class Commands:
         # First collect all expanded paths
         for pattern in filenames:
             expanded_pattern = expanduser(pattern)
+            has_magic = any(c in expanded_pattern for c in "*?[")
             if os.path.isabs(expanded_pattern):
                 # For absolute paths, glob it
-                matches = list(glob.glob(expanded_pattern))
+                if has_magic:
+                    matches = list(glob.glob(expanded_pattern))
+                else:
+                    matches = [expanded_pattern] if os.path.exists(expanded_pattern) else []
+            elif not has_magic:
+                # A literal relative path needs no glob walk
+                literal = Path(self.coder.root) / expanded_pattern
+                matches = [literal] if literal.exists() else []
             else:
-                # For relative paths and globs, use glob from the root directory
+                # For relative globs, glob from the root directory
                 matches = list(Path(self.coder.root).glob(expanded_pattern))
 
             if not matches:
@@ -1635,13 +1646,11 @@ Just show me the edits I need to make.
 
 def expand_subdir(file_path):
     if file_path.is_file():
-        yield file_path
+        yield str(file_path)
         return
 
     if file_path.is_dir():
-        for file in file_path.rglob("*"):
-            if file.is_file():
-                yield file
+        yield from utils.walk_files(file_path)
 
 
 def parse_quoted_filenames(args):
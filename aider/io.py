@@ -315,6 +315,9 @@ class InputOutput:
             self.chat_history_file = None
 
         self.encoding = encoding
+        # base64 image content cached by (mtime_ns, size) so unchanged
+        # images aren't re-read and re-encoded on every prompt build
+        self.image_cache = {}
         valid_line_endings = {"platform", "lf", "crlf"}
         if line_endings not in valid_line_endings:
             raise ValueError(
@@ -425,9 +428,15 @@ class InputOutput:
 
     def read_image(self, filename):
         try:
+            st = os.stat(str(filename))
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self.image_cache.get(filename)
+            if cached and cached[0] == key:
+                return cached[1]
             with open(str(filename), "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read())
-                return encoded_string.decode("utf-8")
+                encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
+            self.image_cache[filename] = (key, encoded_string)
+            return encoded_string
         except OSError as err:
             self.tool_error(f"{filename}: unable to read: {err}")
             return
@@ -450,6 +450,30 @@ def sanity_check_repo(repo, io):
     return False
 
 
+def parse_directory_arg(argv):
+    """Extract the --directory value from argv, or None if it isn't present."""
+    for i, arg in enumerate(argv):
+        if arg == "--directory" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--directory="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def resolve_directory_arg(directory_arg):
+    """Validate a --directory value.
+
+    Returns (resolved_path, None) on success or (None, error_message) when the
+    path is missing or not a directory.
+    """
+    directory_path = Path(directory_arg).expanduser().resolve()
+    if not directory_path.exists():
+        return None, f"Directory {directory_arg} does not exist."
+    if not directory_path.is_dir():
+        return None, f"{directory_arg} is not a directory."
+    return directory_path, None
+
+
 def main(argv=None, input=None, output=None, force_git_root=None, return_coder=False):
     report_uncaught_exceptions()
 
@@ -462,45 +486,20 @@ def main(argv=None, input=None, output=None, force_git_root=None, return_coder=F
     # 1. Git root detection (which looks in current directory)
     # 2. Config file loading (which looks for .aider.conf.yml in current directory)
     # 3. .env file loading (which looks for .env in current directory)
-    directory_arg = None
+    directory_arg = parse_directory_arg(argv)
     directory_changed_early = False
-    for i, arg in enumerate(argv):
-        if arg == "--directory" and i + 1 < len(argv):
-            directory_arg = argv[i + 1]
-            break
-        elif arg.startswith("--directory="):
-            directory_arg = arg.split("=", 1)[1]
-            break
-    
+
     if directory_arg:
         try:
-            directory_path = Path(directory_arg).expanduser().resolve()
-            if not directory_path.exists():
-                # Create a minimal IO object just for error reporting
-                io = InputOutput(
-                    pretty=True,
-                    yes_always=False,
-                    input_history_file=None,
-                    chat_history_file=None,
-                    input=input,
-                    output=output,
-                )
-                io.tool_error(f"Directory {directory_arg} does not exist.")
-                return 1
-            if not directory_path.is_dir():
-                io = InputOutput(
-                    pretty=True,
-                    yes_always=False,
-                    input_history_file=None,
-                    chat_history_file=None,
-                    input=input,
-                    output=output,
-                )
-                io.tool_error(f"{directory_arg} is not a directory.")
-                return 1
-            os.chdir(directory_path)
-            directory_changed_early = True
+            directory_path, directory_error = resolve_directory_arg(directory_arg)
+            if directory_path is not None:
+                os.chdir(directory_path)
+                directory_changed_early = True
         except Exception as e:
+            directory_error = f"Failed to change to directory {directory_arg}: {e}"
+
+        if directory_error:
+            # Create a minimal IO object just for error reporting
             io = InputOutput(
                 pretty=True,
                 yes_always=False,
@@ -509,7 +508,7 @@ def main(argv=None, input=None, output=None, force_git_root=None, return_coder=F
                 input=input,
                 output=output,
             )
-            io.tool_error(f"Failed to change to directory {directory_arg}: {e}")
+            io.tool_error(directory_error)
             return 1
 
     # Now proceed with git root detection in the correct directory
@@ -778,7 +777,7 @@ def main(argv=None, input=None, output=None, force_git_root=None, return_coder=F
     for fn in args.read or []:
         path = Path(fn).expanduser().resolve()
         if path.is_dir():
-            read_only_fnames.extend(str(f) for f in path.rglob("*") if f.is_file())
+            read_only_fnames.extend(utils.walk_files(path))
         else:
             read_only_fnames.append(str(path))
 
@@ -169,16 +169,16 @@ class MarkdownStream:
             self.live.start()
             self._live_started = True
 
-        now = time.time()
+        now = time.monotonic()
         # Throttle updates to maintain smooth rendering
         if not final and now - self.when < self.min_delay:
             return
         self.when = now
 
         # Measure render time and adjust min_delay to maintain smooth rendering
-        start = time.time()
+        start = time.perf_counter()
         lines = self._render_markdown_to_lines(text)
-        render_time = time.time() - start
+        render_time = time.perf_counter() - start
 
         # Set min_delay to render time plus a small buffer
         self.min_delay = min(max(render_time * 10, 1.0 / 20), 2)
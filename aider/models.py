@@ -60,7 +60,7 @@ gpt-3.5-turbo-16k
 gpt-3.5-turbo-16k-0613
 """
 
-OPENAI_MODELS = [ln.strip() for ln in OPENAI_MODELS.splitlines() if ln.strip()]
+OPENAI_MODELS = frozenset(ln.strip() for ln in OPENAI_MODELS.splitlines() if ln.strip())
 
 ANTHROPIC_MODELS = """
 claude-2
@@ -75,7 +75,7 @@ claude-sonnet-4-20250514
 claude-opus-4-20250514
 """
 
-ANTHROPIC_MODELS = [ln.strip() for ln in ANTHROPIC_MODELS.splitlines() if ln.strip()]
+ANTHROPIC_MODELS = frozenset(ln.strip() for ln in ANTHROPIC_MODELS.splitlines() if ln.strip())
 
 # Mapping of model aliases to their canonical names
 MODEL_ALIASES = {
@@ -107,6 +107,17 @@ MODEL_ALIASES = {
     "snowx-o4": "snowx/o4-mini",
     "snowx-r1": "snowx/deepseek-r1",
 }
+# API key environment variable for each provider prefix
+PROVIDER_KEY_MAP = dict(
+    openrouter="OPENROUTER_API_KEY",
+    openai="OPENAI_API_KEY",
+    deepseek="DEEPSEEK_API_KEY",
+    gemini="GEMINI_API_KEY",
+    anthropic="ANTHROPIC_API_KEY",
+    groq="GROQ_API_KEY",
+    fireworks_ai="FIREWORKS_API_KEY",
+)
+
 # Model metadata loaded from resources and user's files.
 
 
@@ -691,22 +702,13 @@ class Model(ModelSettings):
         if provider == "snowx":
             return dict(keys_in_environment=True, missing_keys=[])
 
-        keymap = dict(
-            openrouter="OPENROUTER_API_KEY",
-            openai="OPENAI_API_KEY",
-            deepseek="DEEPSEEK_API_KEY",
-            gemini="GEMINI_API_KEY",
-            anthropic="ANTHROPIC_API_KEY",
-            groq="GROQ_API_KEY",
-            fireworks_ai="FIREWORKS_API_KEY",
-        )
         var = None
         if model in OPENAI_MODELS:
             var = "OPENAI_API_KEY"
         elif model in ANTHROPIC_MODELS:
             var = "ANTHROPIC_API_KEY"
         else:
-            var = keymap.get(provider)
+            var = PROVIDER_KEY_MAP.get(provider)
 
         if var and os.environ.get(var):
             return dict(keys_in_environment=[var], missing_keys=[])
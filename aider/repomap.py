@@ -17,6 +17,7 @@ from pygments.lexers import guess_lexer_for_filename
 from pygments.token import Token
 from tqdm import tqdm
 
+from aider import utils
 from aider.dump import dump
 from aider.special import filter_important_files
 from aider.waiting import Spinner
@@ -768,11 +769,7 @@ def find_src_files(directory):
     if not os.path.isdir(directory):
         return [directory]
 
-    src_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            src_files.append(os.path.join(root, file))
-    return src_files
+    return list(utils.walk_files(directory))
 
 
 def get_random_color():
@@ -7,37 +7,65 @@ various AI models without requiring API keys.
 
 import json
 import time
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Generator
 import requests
 
 from aider.dump import dump  # noqa: F401
 from aider.models import model_info_manager
 
+try:
+    # orjson parses the small SSE payload dicts several times faster than
+    # the stdlib and accepts bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+def _dict_to_obj(d):
+    """Recursively convert dicts to attribute-access objects.
+
+    SimpleNamespace is far cheaper than synthesizing a new class per
+    converted dict, which matters when converting every streaming chunk.
+    """
+    if isinstance(d, dict):
+        return SimpleNamespace(**{k: _dict_to_obj(v) for k, v in d.items()})
+    if isinstance(d, list):
+        return [_dict_to_obj(item) for item in d]
+    return d
+
 
 class SnowXStreamHandler:
     """Handles streaming responses from SnowX API."""
     
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all buffered state so the handler can be reused for a new stream."""
         self.buffer = ""
         self.full_response = ""
         self.thinking_content = ""
         self.regular_content = ""
         self.is_in_thinking_block = False
         self.thinking_buffer = ""
-        
-    def process_line(self, line: str) -> Optional[Dict]:
-        """Process a single line from the streaming response."""
+
+
+    def process_line(self, line) -> Optional[Dict]:
+        """Process a single line (bytes or str) from the streaming response."""
+        if isinstance(line, str):
+            line = line.encode("utf-8")
         line = line.strip()
-        if not line or not line.startswith('data: '):
+        if not line.startswith(b'data: '):
             return None
-            
-        if line == 'data: [DONE]':
+
+        payload = line[6:]  # Remove 'data: ' prefix
+        if payload == b'[DONE]':
             return {"done": True}
-            
+
         try:
-            json_data = line[6:]  # Remove 'data: ' prefix
-            return json.loads(json_data)
-        except json.JSONDecodeError:
+            return json_loads(payload)
+        except ValueError:
             return None
             
     def process_thinking_content(self, text: str) -> Dict[str, str]:
@@ -140,6 +168,10 @@ class SnowXClient:
         "DeepSeek-V3": "FOUNDRY",
     }
     
+    # Models that take max_completion_tokens/reasoning_effort instead of
+    # max_tokens/temperature
+    O4_MINI_MODELS = frozenset({"snowx/o4-mini", "snowx/o4-mini-high"})
+
     def __init__(self):
         self.session = requests.Session()
         
@@ -236,6 +268,7 @@ class SnowXClient:
         
         api_model = self._get_api_model_name(model)
         provider = self._get_provider(api_model)
+        is_o4_mini = model in self.O4_MINI_MODELS
         
         # Convert messages to SnowX format
         snowx_messages = self._convert_messages(messages)
@@ -259,20 +292,20 @@ class SnowXClient:
                 default_max_tokens = model_info.get("max_tokens") or model_info.get("max_output_tokens")
                 
                 # Special handling for o4-mini models
-                if model.startswith("snowx/o4-mini"):
+                if is_o4_mini:
                     # o4-mini uses max_completion_tokens instead of max_tokens
                     request_body["max_completion_tokens"] = default_max_tokens or 100000
                 else:
                     request_body["max_tokens"] = default_max_tokens or 4096
             except Exception:
                 # Fallback to hardcoded defaults if model info not found
-                if model.startswith("snowx/o4-mini"):
+                if is_o4_mini:
                     request_body["max_completion_tokens"] = 100000
                 else:
                     request_body["max_tokens"] = 4096
-                
+
         # Handle o4-mini specific parameters
-        if model != "snowx/o4-mini" and model != "snowx/o4-mini-high":
+        if not is_o4_mini:
             request_body["temperature"] = temperature
             # Only set top_p if explicitly provided in kwargs
             if "top_p" in kwargs:
@@ -329,12 +362,13 @@ class SnowXClient:
         
         handler = SnowXStreamHandler()
         
-        for line in response.iter_lines():
+        # Larger socket reads and bytes-mode parsing: the 'data: ' prefix is
+        # matched on raw bytes and json.loads decodes the payload directly
+        for line in response.iter_lines(chunk_size=65536):
             if not line:
                 continue
-                
-            line_str = line.decode('utf-8')
-            data = handler.process_line(line_str)
+
+            data = handler.process_line(line)
             
             if not data:
                 continue
@@ -372,26 +406,8 @@ class SnowXClient:
                 chunk["choices"].append(chunk_choice)
                 
             if chunk["choices"] and (chunk["choices"][0]["delta"] or chunk["choices"][0]["finish_reason"]):
-                # Convert to object for consistency
-                class StreamChunk:
-                    def __init__(self, data):
-                        self.__dict__.update(data)
-                        # Convert nested dicts to objects
-                        if hasattr(self, 'choices'):
-                            self.choices = [self._dict_to_obj(choice) for choice in self.choices]
-                            
-                    def _dict_to_obj(self, d):
-                        if isinstance(d, dict):
-                            obj = type('obj', (object,), {})()
-                            for k, v in d.items():
-                                setattr(obj, k, self._dict_to_obj(v))
-                            return obj
-                        elif isinstance(d, list):
-                            return [self._dict_to_obj(item) for item in d]
-                        else:
-                            return d
-                            
-                yield StreamChunk(chunk)
+                # Convert to an attribute-access object for consistency
+                yield _dict_to_obj(chunk)
                 
     def _convert_response(self, data: Dict) -> Dict:
         """Convert SnowX response to litellm format."""
@@ -428,28 +444,20 @@ class SnowXClient:
         if "usage" in data:
             response["usage"] = data["usage"]
             
-        # Convert to object-like structure that litellm expects
-        class Response:
-            def __init__(self, data):
-                self.__dict__.update(data)
-                # Convert nested dicts to objects
-                if hasattr(self, 'choices'):
-                    self.choices = [self._dict_to_obj(choice) for choice in self.choices]
-                if hasattr(self, 'usage'):
-                    self.usage = self._dict_to_obj(self.usage)
-                    
-            def _dict_to_obj(self, d):
-                if isinstance(d, dict):
-                    obj = type('obj', (object,), {})()
-                    for k, v in d.items():
-                        setattr(obj, k, self._dict_to_obj(v))
-                    return obj
-                elif isinstance(d, list):
-                    return [self._dict_to_obj(item) for item in d]
-                else:
-                    return d
-                    
-        return Response(response)
+        # Convert to the object-like structure that litellm expects
+        return _dict_to_obj(response)
+
+
+# Shared client so consecutive completions reuse the same requests.Session
+# (connection pooling + HTTP keep-alive) instead of reconnecting per call
+_client: Optional[SnowXClient] = None
+
+
+def _get_client() -> SnowXClient:
+    global _client
+    if _client is None:
+        _client = SnowXClient()
+    return _client
 
 
 # Synchronous wrapper for SnowX client
@@ -460,11 +468,10 @@ def create_snowx_completion(
     **kwargs
 ) -> Any:
     """Create a completion using SnowX API."""
-    
-    client = SnowXClient()
-    return client.create_completion(
+
+    return _get_client().create_completion(
         model=model,
         messages=messages,
         stream=stream,
         **kwargs
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
@@ -11,6 +11,7 @@ from aider.dump import dump  # noqa: F401
 from aider.waiting import Spinner
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".webp", ".pdf"}
+_IMAGE_EXTENSIONS_TUPLE = tuple(IMAGE_EXTENSIONS)
 
 
 class IgnorantTemporaryDirectory:
@@ -82,6 +83,49 @@ def make_repo(path=None):
     return repo
 
 
+# Directories that never hold files worth adding to the chat
+IGNORE_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        "node_modules",
+        ".venv",
+        "venv",
+    }
+)
+
+
+def walk_files(dirname):
+    """
+    Yield the path of every file below `dirname`, recursively.
+
+    Uses os.scandir with an explicit stack instead of Path.rglob, which
+    avoids allocating a Path object per directory entry and reuses the
+    file-type information returned by readdir. Skips VCS metadata,
+    caches and other IGNORE_DIRS subtrees.
+    """
+    stack = [str(dirname)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+
+
 def is_image_file(file_name):
     """
     Check if the given file name has an image file extension.
@@ -90,7 +134,7 @@ def is_image_file(file_name):
     :return: True if the file is an image, False otherwise.
     """
     file_name = str(file_name)  # Convert file_name to string
-    return any(file_name.endswith(ext) for ext in IMAGE_EXTENSIONS)
+    return file_name.endswith(_IMAGE_EXTENSIONS_TUPLE)
 
 
 def safe_abs_path(res):
@@ -32,7 +32,7 @@ class Spinner:
 
     def __init__(self, text: str, width: int = 7):
         self.text = text
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update = 0.0
         self.visible = False
         self.is_tty = sys.stdout.isatty()
@@ -109,7 +109,7 @@ class Spinner:
         if not self.is_tty:
             return
 
-        now = time.time()
+        now = time.monotonic()
         if not self.visible and now - self.start_time >= 0.5:
             self.visible = True
             self.last_update = 0.0
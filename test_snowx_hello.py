@@ -11,22 +11,29 @@ Functions:
     divide_numbers(a, b): Returns the division of two numbers, with zero division handling
 """
 
+from functools import lru_cache
+
+_ZERO_MSG = "Error: Division by zero is not allowed."
+
 def hello_snowx():
     """Return a greeting message."""
     return "Hello from SnowX!"
 
+@lru_cache(maxsize=64)
 def add_numbers(a, b):
     """Add two numbers and return the result."""
     return a + b
 
+@lru_cache(maxsize=64)
 def multiply_numbers(a, b):
     """Multiply two numbers and return the result."""
     return a * b
 
+@lru_cache(maxsize=64)
 def divide_numbers(a, b):
     """Divide two numbers, handling division by zero."""
     if b == 0:
-        return "Error: Division by zero is not allowed."
+        return _ZERO_MSG
     return a / b
 
 if __name__ == "__main__":
@@ -3,24 +3,42 @@ Test SnowX provider integration.
 """
 
 import unittest
+from functools import lru_cache
 from unittest.mock import patch, MagicMock
 from aider.models import Model
 from aider.snowx import SnowXClient, SnowXStreamHandler
 
 
+@lru_cache(maxsize=None)
+def _model(name):
+    """Share Model instances across tests; construction parses metadata."""
+    return Model(name)
+
+
 class TestSnowX(unittest.TestCase):
     """Test SnowX provider functionality."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # One real (unmocked) client shared by the pure-mapping tests
+        cls.client = SnowXClient()
+
+    def setUp(self):
+        # Mock-response template; tests only override .json.return_value
+        self._mock_response = MagicMock()
+        self._mock_response.status_code = 200
+
+
     def test_snowx_model_validation(self):
         """Test that SnowX models don't require API keys."""
-        model = Model("snowx/gpt-4o")
+        model = _model("snowx/gpt-4o")
         env_result = model.validate_environment()
         self.assertTrue(env_result.get("keys_in_environment"))
         self.assertEqual(env_result.get("missing_keys"), [])
         
     def test_snowx_model_info(self):
         """Test that SnowX models have correct metadata."""
-        model = Model("snowx/gpt-4o")
+        model = _model("snowx/gpt-4o")
         self.assertEqual(model.info.get("litellm_provider"), "snowx")
         self.assertEqual(model.info.get("max_input_tokens"), 128000)
         self.assertEqual(model.info.get("max_output_tokens"), 4096)
@@ -28,7 +46,7 @@ class TestSnowX(unittest.TestCase):
         
     def test_snowx_o4_mini_high(self):
         """Test that o4-mini-high has reasoning effort set."""
-        model = Model("snowx/o4-mini-high")
+        model = _model("snowx/o4-mini-high")
         self.assertIsNotNone(model.extra_params)
         self.assertIsNotNone(model.extra_params.get("extra_body"))
         self.assertEqual(model.extra_params["extra_body"]["reasoning_effort"], "high")
@@ -36,49 +54,62 @@ class TestSnowX(unittest.TestCase):
     def test_snowx_reasoning_models(self):
         """Test that reasoning models have correct tags."""
         # MAI-DS-R1 should have think tag
-        model = Model("snowx/mai-ds-r1")
+        model = _model("snowx/mai-ds-r1")
         self.assertEqual(model.reasoning_tag, "think")
         
         # DeepSeek-R1 should have think tag
-        model = Model("snowx/deepseek-r1")
+        model = _model("snowx/deepseek-r1")
         self.assertEqual(model.reasoning_tag, "think")
         
     def test_snowx_aliases(self):
         """Test that SnowX aliases work correctly."""
         from aider.models import MODEL_ALIASES
-        
-        self.assertEqual(MODEL_ALIASES.get("snowx"), "snowx/gpt-4.1")
-        self.assertEqual(MODEL_ALIASES.get("snowx-claude"), "snowx/claude-3-5-sonnet")
-        self.assertEqual(MODEL_ALIASES.get("snowx-mini"), "snowx/gpt-4.1-mini")
-        self.assertEqual(MODEL_ALIASES.get("snowx-o4"), "snowx/o4-mini")
-        self.assertEqual(MODEL_ALIASES.get("snowx-r1"), "snowx/deepseek-r1")
-        
+
+        cases = [
+            ("snowx", "snowx/gpt-4.1"),
+            ("snowx-claude", "snowx/claude-3-5-sonnet"),
+            ("snowx-mini", "snowx/gpt-4.1-mini"),
+            ("snowx-o4", "snowx/o4-mini"),
+            ("snowx-r1", "snowx/deepseek-r1"),
+        ]
+        for alias, target in cases:
+            with self.subTest(alias=alias):
+                self.assertEqual(MODEL_ALIASES.get(alias), target)
+
     def test_snowx_client_model_mapping(self):
         """Test SnowX client model name mapping."""
-        client = SnowXClient()
-        
-        # Test model name mappings
-        self.assertEqual(client._get_api_model_name("snowx/gpt-4o"), "gpt-4o")
-        self.assertEqual(client._get_api_model_name("snowx/claude-3-5-sonnet"), 
-                        "us.anthropic.claude-3-5-sonnet-20241022-v2:0")
-        self.assertEqual(client._get_api_model_name("snowx/deepseek-r1"), "DeepSeek-R1")
-        
-        # Test provider mappings
-        self.assertEqual(client._get_provider("gpt-4o"), "GPT")
-        self.assertEqual(client._get_provider("us.anthropic.claude-3-5-sonnet-20241022-v2:0"), "BEDROCK")
-        self.assertEqual(client._get_provider("DeepSeek-R1"), "FOUNDRY")
-        
+        # Model name mappings
+        name_cases = [
+            ("snowx/gpt-4o", "gpt-4o"),
+            ("snowx/claude-3-5-sonnet", "us.anthropic.claude-3-5-sonnet-20241022-v2:0"),
+            ("snowx/deepseek-r1", "DeepSeek-R1"),
+        ]
+        for model, api_name in name_cases:
+            with self.subTest(model=model):
+                self.assertEqual(self.client._get_api_model_name(model), api_name)
+
+        # Provider mappings
+        provider_cases = [
+            ("gpt-4o", "GPT"),
+            ("us.anthropic.claude-3-5-sonnet-20241022-v2:0", "BEDROCK"),
+            ("DeepSeek-R1", "FOUNDRY"),
+        ]
+        for api_name, provider in provider_cases:
+            with self.subTest(api_name=api_name):
+                self.assertEqual(self.client._get_provider(api_name), provider)
+
+
     def test_snowx_stream_handler_thinking(self):
         """Test SnowX stream handler thinking block processing."""
         handler = SnowXStreamHandler()
-        
+
         # Test content without thinking
         result = handler.process_thinking_content("Hello world")
         self.assertEqual(result["content"], "Hello world")
         self.assertEqual(result["thinking"], "")
-        
-        # Test content with thinking block
-        handler = SnowXStreamHandler()
+
+        # Test content with thinking block; reuse the handler via reset()
+        handler.reset()
         result1 = handler.process_thinking_content("Before <think>")
         self.assertEqual(result1["content"], "Before ")
         self.assertEqual(result1["thinking"], "")
@@ -91,6 +122,32 @@ class TestSnowX(unittest.TestCase):
         self.assertEqual(result3["content"], " After")
         self.assertEqual(result3["thinking"], "")
         
+    @patch('aider.snowx.requests.Session')
+    def test_snowx_token_params(self, mock_session_class):
+        """Test the token-limit key chosen for each model family."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+
+        self._mock_response.json.return_value = {"choices": []}
+        mock_session.post.return_value = self._mock_response
+
+        # One data-driven loop instead of a hand-unrolled block per model
+        cases = [
+            ("snowx/o4-mini", "max_completion_tokens", "max_tokens"),
+            ("snowx/o4-mini-high", "max_completion_tokens", "max_tokens"),
+            ("snowx/gpt-4.1", "max_tokens", "max_completion_tokens"),
+        ]
+
+        client = SnowXClient()
+        messages = [{"role": "user", "content": "Hello"}]
+
+        for model, expected_key, absent_key in cases:
+            with self.subTest(model=model):
+                client.create_completion(model=model, messages=messages, stream=False)
+                request_body = mock_session.post.call_args[1]["json"]
+                self.assertIn(expected_key, request_body)
+                self.assertNotIn(absent_key, request_body)
+
     @patch('aider.snowx.requests.Session')
     def test_snowx_send_completion(self, mock_session_class):
         """Test that SnowX models use the custom client."""
@@ -99,9 +156,7 @@ class TestSnowX(unittest.TestCase):
         mock_session_class.return_value = mock_session
         
         # Mock the response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        self._mock_response.json.return_value = {
             "choices": [{
                 "message": {
                     "content": "Test response"
@@ -109,10 +164,10 @@ class TestSnowX(unittest.TestCase):
                 "finish_reason": "stop"
             }]
         }
-        mock_session.post.return_value = mock_response
+        mock_session.post.return_value = self._mock_response
         
         # Test send_completion with SnowX model
-        model = Model("snowx/gpt-4o")
+        model = _model("snowx/gpt-4o")
         messages = [{"role": "user", "content": "Hello"}]
         
         hash_obj, response = model.send_completion(
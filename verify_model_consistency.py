@@ -1,49 +1,75 @@
 #!/usr/bin/env python3
 """Verify consistency between snowx models and their base counterparts."""
 
+import operator
 import sys
 sys.path.insert(0, '.')
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from aider.models import Model
 
-def compare_models(snowx_name, base_name, description):
-    """Compare key settings between snowx and base models."""
-    snowx_model = Model(snowx_name)
-    base_model = Model(base_name)
-    
-    print(f"\n{description}:")
-    print(f"  Snowx: {snowx_name}")
-    print(f"  Base:  {base_name}")
-    
-    # Compare key settings
-    settings = [
-        ('use_temperature', True),
-        ('edit_format', True),
-        ('use_repo_map', True),
-        ('examples_as_sys_msg', True),
-        ('accepts_settings', True),
-        ('reasoning_tag', False),  # Can be different
-        ('extra_params', False),  # Can be different
-    ]
-    
+# Key settings to compare; the flag marks whether they must match
+SETTINGS = (
+    ('use_temperature', True),
+    ('edit_format', True),
+    ('use_repo_map', True),
+    ('examples_as_sys_msg', True),
+    ('accepts_settings', True),
+    ('reasoning_tag', False),  # Can be different
+    ('extra_params', False),  # Can be different
+)
+
+# One attrgetter call pulls all the settings off a model at once
+get_settings = operator.attrgetter(*(name for name, _ in SETTINGS))
+
+
+@lru_cache(maxsize=None)
+def get_model(name):
+    """Model construction parses metadata; reuse instances across comparisons."""
+    return Model(name)
+
+
+def compare_models(snowx_name, base_name, description, buf):
+    """Compare key settings between snowx and base models.
+
+    Appends report lines to buf instead of printing; the caller emits
+    everything with a single write.
+    """
+    snowx_model = get_model(snowx_name)
+    base_model = get_model(base_name)
+
+    buf.append(f"\n{description}:")
+    buf.append(f"  Snowx: {snowx_name}")
+    buf.append(f"  Base:  {base_name}")
+
+    snowx_vals = get_settings(snowx_model)
+    base_vals = get_settings(base_model)
+
+    # Collect the rows first, then format the whole block with one join
     all_match = True
-    for setting, must_match in settings:
-        snowx_val = getattr(snowx_model, setting, None)
-        base_val = getattr(base_model, setting, None)
-        
+    rows = []
+    for (setting, must_match), snowx_val, base_val in zip(SETTINGS, snowx_vals, base_vals):
         if must_match and snowx_val != base_val:
-            print(f"  ❌ {setting}: snowx={snowx_val} vs base={base_val}")
+            status = "❌"
             all_match = False
         else:
             status = "✅" if snowx_val == base_val else "ℹ️"
-            print(f"  {status} {setting}: snowx={snowx_val} vs base={base_val}")
-    
+        rows.append((status, setting, snowx_val, base_val))
+
+    buf.append(
+        "\n".join(
+            f"  {status} {setting:20} snowx={snowx_val!r:30} base={base_val!r}"
+            for status, setting, snowx_val, base_val in rows
+        )
+    )
+
     return all_match
 
 def main():
-    print("Verifying Consistency Between SnowX and Base Models")
-    print("="*60)
-    
+    buf = ["Verifying Consistency Between SnowX and Base Models", "="*60]
+
     comparisons = [
         # GPT models
         ("snowx/gpt-4o", "openai/gpt-4o", "GPT-4o"),
@@ -63,17 +89,26 @@ def main():
         ("snowx/deepseek-v3", "deepseek/deepseek-chat", "DeepSeek V3"),
     ]
     
+    # Construction reads metadata files, so build all the models up front in
+    # parallel; the comparisons below then hit the warm get_model cache
+    all_names = {name for snowx, base, _ in comparisons for name in (snowx, base)}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(get_model, all_names))
+
     all_pass = True
     for snowx, base, desc in comparisons:
-        if not compare_models(snowx, base, desc):
+        if not compare_models(snowx, base, desc, buf):
             all_pass = False
-    
-    print("\n" + "="*60)
+
+    buf.append("\n" + "="*60)
     if all_pass:
-        print("✅ All critical settings match!")
+        buf.append("✅ All critical settings match!")
     else:
-        print("❌ Some critical settings don't match!")
-    
+        buf.append("❌ Some critical settings don't match!")
+
+    # One write() instead of ~90 line-buffered print calls
+    sys.stdout.write("\n".join(buf) + "\n")
+
     return all_pass
 
 if __name__ == "__main__":